@@ -14,32 +14,73 @@ Checks:
 """
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    def json_loads(data: bytes):
+        # Match orjson: decode explicitly, since json.loads(bytes) would also
+        # accept UTF-16/32 and skip a UTF-8 BOM, and reject NaN/Infinity.
+        text = data.decode("utf-8")
+
+        def reject_constant(name):
+            raise json.JSONDecodeError(f"Invalid constant {name}", text, text.find(name))
+
+        return json.loads(text, parse_constant=reject_constant)
+
 SCRIPT_DIR = Path(__file__).parent
 EN_PATH = SCRIPT_DIR / "en.json"
 
 VAR_RE = re.compile(r"\{(\w+)\}")
+_EMPTY = frozenset()
 
 
 def load_json(path: Path) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def extract_vars(s: str) -> set:
-    return set(VAR_RE.findall(s)) if isinstance(s, str) else set()
-
-
-def validate(locale_path: Path, en: dict) -> list[str]:
+    # orjson (if installed) parses the raw bytes directly; its JSONDecodeError
+    # subclasses json.JSONDecodeError, so callers catch either the same way.
+    # The stdlib fallback raises UnicodeDecodeError for non-UTF-8 input.
+    return json_loads(path.read_bytes())
+
+
+def extract_vars(s: str) -> frozenset:
+    # Callers only pass str values. Most have no placeholders, so skip the
+    # regex engine for those.
+    if "{" not in s:
+        return _EMPTY
+    return frozenset(VAR_RE.findall(s))
+
+
+def build_en_model(en: dict) -> dict:
+    """Precompute everything validate() needs from en.json, once per run."""
+    en_vars = {
+        key: extract_vars(value) if type(value) is str else _EMPTY
+        for key, value in en.items()
+        if key != "_meta"
+    }
+    keys = frozenset(en_vars)
+    # Parallel, sorted arrays so per-file loops walk en keys in a stable order
+    # without a dict lookup per key.
+    keys_list = sorted(keys)
+    return {
+        "keys": keys,
+        "vars": en_vars,
+        "keys_list": keys_list,
+        "vars_list": [en_vars[key] for key in keys_list],
+        "version": en.get("_meta", {}).get("version"),
+    }
+
+
+def validate(locale_path: Path, en_model: dict) -> list[str]:
     errors = []
 
     # 1. Valid JSON
     try:
         loc = load_json(locale_path)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         return [f"Invalid JSON: {e}"]
 
     if not isinstance(loc, dict):
@@ -47,45 +88,48 @@ def validate(locale_path: Path, en: dict) -> list[str]:
 
     # 2. Check _meta
     meta = loc.get("_meta", {})
+    if not isinstance(meta, dict):
+        errors.append("_meta must be a JSON object")
+        meta = {}
     if not meta.get("lang"):
         errors.append("_meta.lang is missing")
     if not meta.get("name"):
         errors.append("_meta.name is missing")
-    if meta.get("version") != en.get("_meta", {}).get("version"):
+    if meta.get("version") != en_model["version"]:
         errors.append(
-            f"_meta.version mismatch: got {meta.get('version')}, expected {en['_meta']['version']}"
+            f"_meta.version mismatch: got {meta.get('version')}, expected {en_model['version']}"
         )
 
     # 3. Missing keys
-    en_keys = set(en.keys()) - {"_meta"}
-    loc_keys = set(loc.keys()) - {"_meta"}
+    loc_keys = loc.keys() - {"_meta"}
 
-    missing = en_keys - loc_keys
+    # keys_list is already sorted, so this needs neither a set nor a sort
+    missing = [key for key in en_model["keys_list"] if key not in loc_keys]
     if missing:
-        errors.append(f"Missing keys ({len(missing)}): {', '.join(sorted(missing))}")
+        errors.append(f"Missing keys ({len(missing)}): {', '.join(missing)}")
 
     # 4. Extra keys
-    extra = loc_keys - en_keys
+    extra = loc_keys - en_model["keys"]
     if extra:
         errors.append(f"Extra keys ({len(extra)}): {', '.join(sorted(extra))}")
 
-    # 5. Template variables preserved
-    for key in en_keys & loc_keys:
-        en_vars = extract_vars(en[key])
-        loc_vars = extract_vars(loc[key])
+    # 5. Template variables preserved, 6. empty values (warn, not error)
+    for key, en_vars in zip(en_model["keys_list"], en_model["vars_list"]):
+        if key not in loc_keys:
+            continue
+        value = loc[key]
+        is_str = type(value) is str
+        loc_vars = extract_vars(value) if is_str else _EMPTY
         if en_vars != loc_vars:
             missing_vars = en_vars - loc_vars
             extra_vars = loc_vars - en_vars
             parts = []
             if missing_vars:
-                parts.append(f"missing {{{', '.join(missing_vars)}}}")
+                parts.append(f"missing {{{', '.join(sorted(missing_vars))}}}")
             if extra_vars:
-                parts.append(f"extra {{{', '.join(extra_vars)}}}")
+                parts.append(f"extra {{{', '.join(sorted(extra_vars))}}}")
             errors.append(f"Key '{key}': template variable mismatch — {'; '.join(parts)}")
-
-    # 6. Empty values (warn, not error)
-    for key in en_keys & loc_keys:
-        if isinstance(loc[key], str) and not loc[key].strip():
+        if is_str and not value.strip():
             errors.append(f"Key '{key}': empty value (untranslated?)")
 
     return errors
@@ -96,33 +140,47 @@ def main():
         print(f"Usage: {sys.argv[0]} <locale.json> | --all")
         sys.exit(1)
 
-    en = load_json(EN_PATH)
+    en_model = build_en_model(load_json(EN_PATH))
 
     if sys.argv[1] == "--all":
-        files = sorted(SCRIPT_DIR.glob("*.json"))
-        files = [f for f in files if f.name != "en.json"]
+        files = sorted(
+            SCRIPT_DIR / e.name
+            for e in os.scandir(SCRIPT_DIR)
+            if e.name.endswith(".json") and e.name != "en.json" and e.is_file()
+        )
         if not files:
             print("No locale files found (besides en.json)")
             sys.exit(0)
     else:
         files = [Path(sys.argv[1])]
 
+    # Collect the report and write it once rather than print() per line
+    out = []
     total_errors = 0
     for fp in files:
-        errors = validate(fp, en)
+        errors = validate(fp, en_model)
         if errors:
-            print(f"\n✗ {fp.name} — {len(errors)} issue(s):")
-            for e in errors:
-                print(f"  - {e}")
+            out.append(f"\n✗ {fp.name} — {len(errors)} issue(s):\n")
+            out.extend(f"  - {e}\n" for e in errors)
             total_errors += len(errors)
         else:
-            print(f"✓ {fp.name} — OK")
+            out.append(f"✓ {fp.name} — OK\n")
 
     if total_errors:
-        print(f"\n{total_errors} total issue(s) found.")
-        sys.exit(1)
+        out.append(f"\n{total_errors} total issue(s) found.\n")
+    else:
+        out.append("\nAll locale files valid.\n")
+    report = "".join(out)
+    # Skip the text wrapper when stdout is a UTF-8 byte stream; otherwise (a
+    # replaced stdout, another console encoding) write text as print() would
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None and (sys.stdout.encoding or "").lower() in ("utf-8", "utf8"):
+        sys.stdout.flush()
+        buf.write(report.encode("utf-8"))
+        buf.flush()
     else:
-        print("\nAll locale files valid.")
+        sys.stdout.write(report)
+    sys.exit(1 if total_errors else 0)
 
 
 if __name__ == "__main__":
@@ -3,97 +3,155 @@
 import json
 import re
 import sys
+from collections import Counter
 from pathlib import Path
 
-REQUIRED_MODEL_FIELDS = {"id", "name", "provider", "context", "maxOutput", "pricing", "capabilities", "tier"}
-ALLOWED_CAPABILITIES = {"vision", "tools", "streaming", "json_mode", "reasoning", "code"}
-ALLOWED_TIERS = {"free", "paid", "enterprise"}
-REQUIRED_PROVIDER_FIELDS = {"name", "baseUrl", "authType", "format"}
+try:
+    # Parses bytes directly; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    def json_loads(data: bytes):
+        # Match orjson: decode explicitly, since json.loads(bytes) would also
+        # accept UTF-16/32 and skip a UTF-8 BOM, and reject NaN/Infinity.
+        text = data.decode("utf-8")
+
+        def reject_constant(name):
+            raise json.JSONDecodeError(f"Invalid constant {name}", text, text.find(name))
+
+        return json.loads(text, parse_constant=reject_constant)
+
+REQUIRED_MODEL_FIELDS = frozenset({"id", "name", "provider", "context", "maxOutput", "pricing", "capabilities", "tier"})
+ALLOWED_CAPABILITIES = frozenset({"vision", "tools", "streaming", "json_mode", "reasoning", "code"})
+ALLOWED_TIERS = frozenset({"free", "paid", "enterprise"})
+REQUIRED_PROVIDER_FIELDS = frozenset({"name", "baseUrl", "authType", "format"})
+VALID_COUNCIL_STYLES = frozenset({"research", "compare", "arena", "moa", "router", "debate", "consensus"})
 
 # Package registry constants
-ALLOWED_PACKAGE_TYPES = {"plugin", "addon", "mini-program"}
-ALLOWED_REGISTRY_TIERS = {"community", "ai-verified", "verified", "platform"}
-ALLOWED_VERIFICATION_TIERS = {"quick", "full", "deep"}
-HASH_RE = re.compile(r'^[0-9a-f]{64}$')
+ALLOWED_PACKAGE_TYPES = frozenset({"plugin", "addon", "mini-program"})
+ALLOWED_REGISTRY_TIERS = frozenset({"community", "ai-verified", "verified", "platform"})
+ALLOWED_VERIFICATION_TIERS = frozenset({"quick", "full", "deep"})
+# DATE_RE and VERSION_RE are prefix checks (.match, no '$'): dates may carry
+# a time part and versions a pre-release/build suffix.
 DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+# Fully anchored patterns are checked with .fullmatch(): with .match(), '$'
+# also accepts a trailing newline.
+HASH_RE = re.compile(r'^[0-9a-f]{64}$')
 JOB_ID_RE = re.compile(r'^ver_[a-zA-Z0-9]+$')
-ALLOWED_PERMISSIONS = {
+ALLOWED_PERMISSIONS = frozenset({
     "storage", "chat:read", "chat:write", "config:read", "config:write",
     "auth:read", "ui:toast", "ui:modal", "hooks:action", "hooks:filter",
     "network:fetch", "secrets:sync"
-}
+})
 NAME_RE = re.compile(r'^[a-z0-9-]+$')
 VERSION_RE = re.compile(r'^\d+\.\d+\.\d+')
 
 
-def validate(path: str = None) -> list[str]:
-    """Validate the model registry. Returns list of error strings."""
-    if path is None:
-        path = Path(__file__).parent / "models.json"
-    else:
-        path = Path(path)
+def _is_sha256_hex(value) -> bool:
+    """True if value is a string HASH_RE fully matches (64 lowercase hex chars).
 
-    errors = []
+    Deleting the hex digits with bytes.translate leaves nothing for a valid
+    digest; this is about twice as fast as a regex fullmatch.
+    """
+    return (
+        type(value) is str
+        and len(value) == 64
+        and value.isascii()
+        and not value.encode().translate(None, b"0123456789abcdef")
+    )
+
+
+def _fmt_set(values) -> str:
+    """Format values like a set literal, sorted so messages are stable."""
+    return "{" + ", ".join(sorted(set(map(repr, values)))) + "}"
+
+
+def _duplicates(values) -> list[tuple]:
+    """Return (value, count) for every value that occurs more than once."""
+    return [(value, count) for value, count in Counter(values).items() if count > 1]
+
+
+_REGISTRY_DIR = Path(__file__).parent
+_DEFAULT_MODELS_PATH = _REGISTRY_DIR / "models.json"
+_DEFAULT_PACKAGES_PATH = _REGISTRY_DIR / "packages.json"
+_DEFAULT_THEMES_PATH = _REGISTRY_DIR / "themes.json"
+_DEFAULT_TEMPLATES_PATH = _REGISTRY_DIR / "templates.json"
+
+
+def _load_json(path: str, default_path: Path) -> tuple[dict, list[str]]:
+    """Read and parse a registry file. Returns (data, errors); data is None on failure."""
+    path = default_path if path is None else Path(path)
 
     try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError as e:
-        return [f"Invalid JSON: {e}"]
+        return json_loads(path.read_bytes()), []
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return None, [f"Invalid JSON: {e}"]
     except FileNotFoundError:
-        return [f"File not found: {path}"]
+        return None, [f"File not found: {path}"]
+
+
+def _validate_models(path: str = None) -> tuple[list[str], dict]:
+    """Validate the model registry. Returns (errors, parsed data or None if unreadable)."""
+    data, errors = _load_json(path, _DEFAULT_MODELS_PATH)
+    if errors:
+        return errors, None
 
     # Top-level fields
     if "version" not in data:
         errors.append("Missing top-level 'version' field")
     if "providers" not in data:
         errors.append("Missing 'providers' object")
-        return errors
+        return errors, data
     if "models" not in data:
         errors.append("Missing 'models' array")
-        return errors
+        return errors, data
 
     providers = data["providers"]
     models = data["models"]
 
     # Validate providers
     for pid, prov in providers.items():
-        missing = REQUIRED_PROVIDER_FIELDS - set(prov.keys())
+        if type(prov) is not dict:
+            errors.append(f"Provider '{pid}' must be an object")
+            continue
+        missing = [f for f in REQUIRED_PROVIDER_FIELDS if f not in prov]
         if missing:
-            errors.append(f"Provider '{pid}' missing fields: {missing}")
+            errors.append(f"Provider '{pid}' missing fields: {_fmt_set(missing)}")
 
     # Validate models
-    seen_ids = set()
     for i, model in enumerate(models):
+        if type(model) is not dict:
+            errors.append(f"Model [{i}]: must be an object")
+            continue
         prefix = f"Model [{i}] '{model.get('id', '?')}'"
 
         # Required fields
-        missing = REQUIRED_MODEL_FIELDS - set(model.keys())
+        missing = [f for f in REQUIRED_MODEL_FIELDS if f not in model]
         if missing:
-            errors.append(f"{prefix}: missing fields: {missing}")
+            errors.append(f"{prefix}: missing fields: {_fmt_set(missing)}")
             continue
 
-        # Duplicate IDs
-        if model["id"] in seen_ids:
-            errors.append(f"{prefix}: duplicate model ID")
-        seen_ids.add(model["id"])
-
         # Provider exists
         if model["provider"] not in providers:
             errors.append(f"{prefix}: unknown provider '{model['provider']}'")
 
         # Tier valid
         if model["tier"] not in ALLOWED_TIERS:
-            errors.append(f"{prefix}: invalid tier '{model['tier']}' (allowed: {ALLOWED_TIERS})")
+            errors.append(f"{prefix}: invalid tier '{model['tier']}' (allowed: {_fmt_set(ALLOWED_TIERS)})")
 
         # Capabilities valid
-        invalid_caps = set(model["capabilities"]) - ALLOWED_CAPABILITIES
+        invalid_caps = [c for c in model["capabilities"] if c not in ALLOWED_CAPABILITIES]
         if invalid_caps:
-            errors.append(f"{prefix}: invalid capabilities {invalid_caps}")
+            errors.append(f"{prefix}: invalid capabilities {_fmt_set(invalid_caps)}")
 
         # Pricing non-negative
-        pricing = model.get("pricing", {})
-        if pricing.get("input", 0) < 0 or pricing.get("output", 0) < 0:
-            errors.append(f"{prefix}: pricing must be non-negative")
+        pricing = model["pricing"]
+        if type(pricing) is not dict:
+            errors.append(f"{prefix}: pricing must be an object")
+        else:
+            p_in = pricing["input"] if "input" in pricing else 0
+            p_out = pricing["output"] if "output" in pricing else 0
+            if p_in < 0 or p_out < 0:
+                errors.append(f"{prefix}: pricing must be non-negative")
 
         # Context/maxOutput positive
         if model["context"] <= 0:
@@ -101,44 +159,51 @@ def validate(path: str = None) -> list[str]:
         if model["maxOutput"] <= 0:
             errors.append(f"{prefix}: maxOutput must be positive")
 
+    # Duplicate IDs
+    for model_id, count in _duplicates(m["id"] for m in models if type(m) is dict and "id" in m):
+        errors.append(f"Model '{model_id}': duplicate model ID ({count} occurrences)")
+
     # Validate presetCouncils
-    VALID_COUNCIL_STYLES = {"research", "compare", "arena", "moa", "router", "debate", "consensus"}
-    NEEDS_CHAIRMAN = {"research", "moa", "router", "debate"}
     if "presetCouncils" in data:
         pcs = data["presetCouncils"]
-        if not isinstance(pcs, list):
+        if type(pcs) is not list:
             errors.append("'presetCouncils' must be an array")
         else:
             for i, pc in enumerate(pcs):
-                prefix = f"PresetCouncil [{i}] '{pc.get('name', '?')}'"
-                if not isinstance(pc, dict):
+                if type(pc) is not dict:
                     errors.append(f"PresetCouncil [{i}]: must be an object")
                     continue
+                prefix = f"PresetCouncil [{i}] '{pc.get('name', '?')}'"
                 for req in ("name", "style", "members"):
                     if req not in pc:
                         errors.append(f"{prefix}: missing '{req}'")
                 if "style" in pc and pc["style"] not in VALID_COUNCIL_STYLES:
-                    errors.append(f"{prefix}: invalid style '{pc['style']}' (allowed: {VALID_COUNCIL_STYLES})")
-                if "simpleDescription" in pc and not isinstance(pc["simpleDescription"], str):
+                    errors.append(f"{prefix}: invalid style '{pc['style']}' (allowed: {_fmt_set(VALID_COUNCIL_STYLES)})")
+                if "simpleDescription" in pc and type(pc["simpleDescription"]) is not str:
                     errors.append(f"{prefix}: simpleDescription must be a string")
                 if "chairman" in pc:
                     ch = pc["chairman"]
-                    if ch is not None and not isinstance(ch, int):
+                    if ch is not None and type(ch) is not int:
                         errors.append(f"{prefix}: chairman must be an integer or null")
-                    elif isinstance(ch, int) and "members" in pc and isinstance(pc["members"], list):
+                    elif type(ch) is int and "members" in pc and type(pc["members"]) is list:
                         if ch < 0 or ch >= len(pc["members"]):
                             errors.append(f"{prefix}: chairman index {ch} out of range (0-{len(pc['members'])-1})")
                 if "members" in pc:
-                    if not isinstance(pc["members"], list) or len(pc["members"]) < 2:
+                    if type(pc["members"]) is not list or len(pc["members"]) < 2:
                         errors.append(f"{prefix}: members must be an array with at least 2 entries")
                     else:
                         for j, m in enumerate(pc["members"]):
-                            if not isinstance(m, dict):
+                            if type(m) is not dict:
                                 errors.append(f"{prefix} member [{j}]: must be an object")
                             elif "provider" not in m or "model" not in m:
                                 errors.append(f"{prefix} member [{j}]: missing 'provider' or 'model'")
 
-    return errors
+    return errors, data
+
+
+def validate(path: str = None) -> list[str]:
+    """Validate the model registry. Returns list of error strings."""
+    return _validate_models(path)[0]
 
 
 def validate_manifest(manifest: dict) -> list[str]:
@@ -149,7 +214,7 @@ def validate_manifest(manifest: dict) -> list[str]:
     # Required fields
     if "name" not in manifest:
         errors.append(f"{prefix}: missing 'name'")
-    elif not NAME_RE.match(manifest["name"]):
+    elif not NAME_RE.fullmatch(manifest["name"]):
         errors.append(f"{prefix}: name must match ^[a-z0-9-]+$ (got '{manifest['name']}')")
     elif len(manifest["name"]) > 64:
         errors.append(f"{prefix}: name exceeds 64 characters")
@@ -166,7 +231,7 @@ def validate_manifest(manifest: dict) -> list[str]:
     # Type
     pkg_type = manifest.get("type", "plugin")
     if pkg_type not in ALLOWED_PACKAGE_TYPES:
-        errors.append(f"{prefix}: invalid type '{pkg_type}' (allowed: {ALLOWED_PACKAGE_TYPES})")
+        errors.append(f"{prefix}: invalid type '{pkg_type}' (allowed: {_fmt_set(ALLOWED_PACKAGE_TYPES)})")
 
     # Type-specific requirements
     if pkg_type == "mini-program":
@@ -179,7 +244,7 @@ def validate_manifest(manifest: dict) -> list[str]:
             errors.append(f"{prefix}: plugin requires 'wasm' field")
         if "wasm_sha256" not in manifest:
             errors.append(f"{prefix}: plugin requires 'wasm_sha256' field")
-        elif manifest.get("wasm_sha256") and not re.match(r'^[0-9a-f]{64}$', manifest["wasm_sha256"]):
+        elif manifest.get("wasm_sha256") and not _is_sha256_hex(manifest["wasm_sha256"]):
             errors.append(f"{prefix}: wasm_sha256 must be 64 hex characters")
     elif pkg_type == "addon":
         if "wasm" not in manifest and "entry" not in manifest:
@@ -187,12 +252,12 @@ def validate_manifest(manifest: dict) -> list[str]:
 
     # Permissions
     if "permissions" in manifest:
-        if not isinstance(manifest["permissions"], list):
+        if type(manifest["permissions"]) is not list:
             errors.append(f"{prefix}: permissions must be an array")
         else:
-            invalid = set(manifest["permissions"]) - ALLOWED_PERMISSIONS
+            invalid = [p for p in manifest["permissions"] if p not in ALLOWED_PERMISSIONS]
             if invalid:
-                errors.append(f"{prefix}: invalid permissions {invalid}")
+                errors.append(f"{prefix}: invalid permissions {_fmt_set(invalid)}")
 
     # Description length
     if "description" in manifest and len(manifest["description"]) > 256:
@@ -200,7 +265,7 @@ def validate_manifest(manifest: dict) -> list[str]:
 
     # Keywords
     if "keywords" in manifest:
-        if not isinstance(manifest["keywords"], list):
+        if type(manifest["keywords"]) is not list:
             errors.append(f"{prefix}: keywords must be an array")
         elif len(manifest["keywords"]) > 10:
             errors.append(f"{prefix}: max 10 keywords allowed")
@@ -208,48 +273,32 @@ def validate_manifest(manifest: dict) -> list[str]:
     return errors
 
 
-def validate_packages(path: str = None) -> list[str]:
-    """Validate the package registry. Returns list of error strings."""
-    if path is None:
-        path = Path(__file__).parent / "packages.json"
-    else:
-        path = Path(path)
-
-    errors = []
-
-    try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError as e:
-        return [f"Invalid JSON: {e}"]
-    except FileNotFoundError:
-        return [f"File not found: {path}"]
+def _validate_packages(path: str = None) -> tuple[list[str], dict]:
+    """Validate the package registry. Returns (errors, parsed data or None if unreadable)."""
+    data, errors = _load_json(path, _DEFAULT_PACKAGES_PATH)
+    if errors:
+        return errors, None
 
     if "version" not in data:
         errors.append("Missing top-level 'version' field")
     if "packages" not in data:
         errors.append("Missing 'packages' array")
-        return errors
+        return errors, data
 
     packages = data["packages"]
-    if not isinstance(packages, list):
+    if type(packages) is not list:
         errors.append("'packages' must be an array")
-        return errors
+        return errors, data
 
-    seen_names = set()
     for i, pkg in enumerate(packages):
-        prefix = f"Package [{i}] '{pkg.get('name', '?')}'"
-
-        if not isinstance(pkg, dict):
+        if type(pkg) is not dict:
             errors.append(f"Package [{i}]: must be an object")
             continue
+        prefix = f"Package [{i}] '{pkg.get('name', '?')}'"
 
         # Required registry fields
         if "name" not in pkg:
             errors.append(f"{prefix}: missing 'name'")
-        elif pkg["name"] in seen_names:
-            errors.append(f"{prefix}: duplicate package name")
-        else:
-            seen_names.add(pkg["name"])
 
         if "type" not in pkg:
             errors.append(f"{prefix}: missing 'type'")
@@ -267,22 +316,23 @@ def validate_packages(path: str = None) -> list[str]:
         # Marketplace tier
         if "tier" in pkg:
             if pkg["tier"] not in ALLOWED_REGISTRY_TIERS:
-                errors.append(f"{prefix}: invalid tier '{pkg['tier']}' (allowed: {ALLOWED_REGISTRY_TIERS})")
+                errors.append(f"{prefix}: invalid tier '{pkg['tier']}' (allowed: {_fmt_set(ALLOWED_REGISTRY_TIERS)})")
 
         # Pricing
         if "price" in pkg:
-            if not isinstance(pkg["price"], (int, float)):
+            price = pkg["price"]
+            if type(price) is not int and type(price) is not float:
                 errors.append(f"{prefix}: price must be a number (cents)")
-            elif pkg["price"] < 0:
+            elif price < 0:
                 errors.append(f"{prefix}: price must be non-negative")
             # Paid apps need a seller (null = platform-owned, allowed)
-            if pkg.get("price", 0) > 0 and "seller" not in pkg:
+            elif price > 0 and "seller" not in pkg:
                 errors.append(f"{prefix}: paid packages require a 'seller' field (null for platform-owned, or {{name, id}} for third-party)")
 
         # Seller
         if "seller" in pkg and pkg["seller"] is not None:
             seller = pkg["seller"]
-            if not isinstance(seller, dict):
+            if type(seller) is not dict:
                 errors.append(f"{prefix}: seller must be an object or null")
             else:
                 if "name" not in seller:
@@ -293,17 +343,17 @@ def validate_packages(path: str = None) -> list[str]:
         # Verification badge
         if "verification" in pkg:
             v = pkg["verification"]
-            if not isinstance(v, dict):
+            if type(v) is not dict:
                 errors.append(f"{prefix}: verification must be an object")
             else:
                 if "hash" not in v:
                     errors.append(f"{prefix}: verification missing 'hash'")
-                elif not HASH_RE.match(v["hash"]):
+                elif not _is_sha256_hex(v["hash"]):
                     errors.append(f"{prefix}: verification hash must be 64 hex characters")
                 if "tier" not in v:
                     errors.append(f"{prefix}: verification missing 'tier'")
                 elif v["tier"] not in ALLOWED_VERIFICATION_TIERS:
-                    errors.append(f"{prefix}: invalid verification tier '{v['tier']}' (allowed: {ALLOWED_VERIFICATION_TIERS})")
+                    errors.append(f"{prefix}: invalid verification tier '{v['tier']}' (allowed: {_fmt_set(ALLOWED_VERIFICATION_TIERS)})")
                 if "date" not in v:
                     errors.append(f"{prefix}: verification missing 'date'")
                 elif not DATE_RE.match(v["date"]):
@@ -314,7 +364,7 @@ def validate_packages(path: str = None) -> list[str]:
                     errors.append(f"{prefix}: verification expires must be ISO 8601 (YYYY-MM-DD)")
                 if "job_id" not in v:
                     errors.append(f"{prefix}: verification missing 'job_id'")
-                elif not JOB_ID_RE.match(v["job_id"]):
+                elif not JOB_ID_RE.fullmatch(v["job_id"]):
                     errors.append(f"{prefix}: verification job_id must match ver_[a-zA-Z0-9]+")
 
             # ai-verified tier requires verification object
@@ -328,59 +378,64 @@ def validate_packages(path: str = None) -> list[str]:
 
         # Category validation
         if "category" in pkg:
-            if not isinstance(pkg["category"], str):
+            if type(pkg["category"]) is not str:
                 errors.append(f"{prefix}: category must be a string")
 
-    return errors
+    for name, count in _duplicates(p["name"] for p in packages if type(p) is dict and "name" in p):
+        errors.append(f"Package '{name}': duplicate package name ({count} occurrences)")
+
+    return errors, data
+
+
+def validate_packages(path: str = None) -> list[str]:
+    """Validate the package registry. Returns list of error strings."""
+    return _validate_packages(path)[0]
 
 
 CSS_PROP_NAME_RE = re.compile(r'^--[a-z][-a-z0-9]+$')
 CSS_FORBIDDEN_VALUES = re.compile(r'url\s*\(|expression\s*\(|javascript:|@import', re.IGNORECASE)
 XSS_FORBIDDEN = re.compile(r'<script|onclick|onerror|onload|javascript:', re.IGNORECASE)
-VALID_SIDEBAR_PANELS = {"left", "chat", "right"}
-VALID_WELCOME_ACTIONS = {"focus-input", "open-config", "new-council", "open-settings"}
+# Union of the two above: clean values (the common case) are scanned once, and
+# only a hit is re-checked against each pattern to pick the error message.
+CSS_OR_XSS_FORBIDDEN = re.compile(f"{CSS_FORBIDDEN_VALUES.pattern}|{XSS_FORBIDDEN.pattern}", re.IGNORECASE)
+_CSS_OR_XSS_FORBIDDEN_LOWER = re.compile(CSS_OR_XSS_FORBIDDEN.pattern)
+VALID_SIDEBAR_PANELS = frozenset({"left", "chat", "right"})
+VALID_WELCOME_ACTIONS = frozenset({"focus-input", "open-config", "new-council", "open-settings"})
 
 
-def validate_themes(path: str = None) -> list[str]:
-    """Validate the themes registry. Returns list of error strings."""
-    if path is None:
-        path = Path(__file__).parent / "themes.json"
-    else:
-        path = Path(path)
+def _has_forbidden_css_or_xss(value: str) -> bool:
+    """Fast prefilter for CSS_OR_XSS_FORBIDDEN."""
+    # For ASCII text, lowercasing once and matching case-sensitively is exactly
+    # equivalent to re.IGNORECASE and several times faster on large css blobs.
+    if value.isascii():
+        return _CSS_OR_XSS_FORBIDDEN_LOWER.search(value.lower()) is not None
+    return CSS_OR_XSS_FORBIDDEN.search(value) is not None
 
-    errors = []
 
-    try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError as e:
-        return [f"Invalid JSON: {e}"]
-    except FileNotFoundError:
-        return [f"File not found: {path}"]
+def _validate_themes(path: str = None) -> tuple[list[str], dict]:
+    """Validate the themes registry. Returns (errors, parsed data or None if unreadable)."""
+    data, errors = _load_json(path, _DEFAULT_THEMES_PATH)
+    if errors:
+        return errors, None
 
     if "version" not in data:
         errors.append("Missing top-level 'version' field")
     if "themes" not in data:
         errors.append("Missing 'themes' array")
-        return errors
-    if not isinstance(data["themes"], list):
+        return errors, data
+    if type(data["themes"]) is not list:
         errors.append("'themes' must be an array")
-        return errors
+        return errors, data
 
-    seen_ids = set()
     for i, theme in enumerate(data["themes"]):
-        prefix = f"Theme [{i}] '{theme.get('id', '?')}'"
-
-        if not isinstance(theme, dict):
+        if type(theme) is not dict:
             errors.append(f"Theme [{i}]: must be an object")
             continue
+        prefix = f"Theme [{i}] '{theme.get('id', '?')}'"
 
         # Required fields
         if "id" not in theme:
             errors.append(f"{prefix}: missing 'id'")
-        elif theme["id"] in seen_ids:
-            errors.append(f"{prefix}: duplicate theme ID")
-        else:
-            seen_ids.add(theme["id"])
 
         if "name" not in theme:
             errors.append(f"{prefix}: missing 'name'")
@@ -389,86 +444,81 @@ def validate_themes(path: str = None) -> list[str]:
         for mode in ("light", "dark"):
             if mode not in theme:
                 continue
-            if not isinstance(theme[mode], dict):
+            if type(theme[mode]) is not dict:
                 errors.append(f"{prefix}: '{mode}' must be an object")
                 continue
             for prop_name, prop_value in theme[mode].items():
-                if not CSS_PROP_NAME_RE.match(prop_name):
+                if not CSS_PROP_NAME_RE.fullmatch(prop_name):
                     errors.append(f"{prefix}: {mode} property name '{prop_name}' must match --[a-z][-a-z]+")
-                if not isinstance(prop_value, str):
+                if type(prop_value) is not str:
                     errors.append(f"{prefix}: {mode} property '{prop_name}' value must be a string")
-                elif CSS_FORBIDDEN_VALUES.search(prop_value):
-                    errors.append(f"{prefix}: {mode} property '{prop_name}' contains forbidden value pattern (url(), expression(), javascript:, @import)")
-                elif XSS_FORBIDDEN.search(prop_value):
-                    errors.append(f"{prefix}: {mode} property '{prop_name}' contains XSS pattern")
+                elif _has_forbidden_css_or_xss(prop_value):
+                    if CSS_FORBIDDEN_VALUES.search(prop_value):
+                        errors.append(f"{prefix}: {mode} property '{prop_name}' contains forbidden value pattern (url(), expression(), javascript:, @import)")
+                    else:
+                        errors.append(f"{prefix}: {mode} property '{prop_name}' contains XSS pattern")
 
         # Validate layout
         if "layout" in theme:
             layout = theme["layout"]
-            if not isinstance(layout, dict):
+            if type(layout) is not dict:
                 errors.append(f"{prefix}: 'layout' must be an object")
             else:
                 if "sidebarOrder" in layout:
                     order = layout["sidebarOrder"]
-                    if not isinstance(order, list):
+                    if type(order) is not list:
                         errors.append(f"{prefix}: layout.sidebarOrder must be an array")
                     else:
                         for val in order:
                             if val not in VALID_SIDEBAR_PANELS:
-                                errors.append(f"{prefix}: layout.sidebarOrder contains invalid panel '{val}' (allowed: {VALID_SIDEBAR_PANELS})")
+                                errors.append(f"{prefix}: layout.sidebarOrder contains invalid panel '{val}' (allowed: {_fmt_set(VALID_SIDEBAR_PANELS)})")
 
         # Validate custom CSS field
         if "css" in theme:
             css = theme["css"]
-            if not isinstance(css, str):
+            if type(css) is not str:
                 errors.append(f"{prefix}: 'css' must be a string")
             elif len(css) > 50000:
                 errors.append(f"{prefix}: css exceeds 50,000 characters")
-            else:
+            elif _has_forbidden_css_or_xss(css):
                 if CSS_FORBIDDEN_VALUES.search(css):
                     errors.append(f"{prefix}: css contains forbidden pattern (url(), expression(), javascript:, @import)")
                 if XSS_FORBIDDEN.search(css):
                     errors.append(f"{prefix}: css contains XSS pattern")
 
-    return errors
+    themes = data["themes"]
+    for theme_id, count in _duplicates(t["id"] for t in themes if type(t) is dict and "id" in t):
+        errors.append(f"Theme '{theme_id}': duplicate theme ID ({count} occurrences)")
 
+    return errors, data
 
-def validate_templates(path: str = None) -> list[str]:
-    """Validate the templates registry. Returns list of error strings."""
-    if path is None:
-        path = Path(__file__).parent / "templates.json"
-    else:
-        path = Path(path)
 
-    errors = []
+def validate_themes(path: str = None) -> list[str]:
+    """Validate the themes registry. Returns list of error strings."""
+    return _validate_themes(path)[0]
 
-    try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError as e:
-        return [f"Invalid JSON: {e}"]
-    except FileNotFoundError:
-        return [f"File not found: {path}"]
+
+def _validate_templates(path: str = None) -> tuple[list[str], dict]:
+    """Validate the templates registry. Returns (errors, parsed data or None if unreadable)."""
+    data, errors = _load_json(path, _DEFAULT_TEMPLATES_PATH)
+    if errors:
+        return errors, None
 
     if "version" not in data:
         errors.append("Missing top-level 'version' field")
 
     # Validate system prompts
     if "systemPrompts" in data:
-        if not isinstance(data["systemPrompts"], list):
+        if type(data["systemPrompts"]) is not list:
             errors.append("'systemPrompts' must be an array")
         else:
-            seen_ids = set()
             for i, prompt in enumerate(data["systemPrompts"]):
-                prefix = f"SystemPrompt [{i}] '{prompt.get('id', '?')}'"
-                if not isinstance(prompt, dict):
+                if type(prompt) is not dict:
                     errors.append(f"SystemPrompt [{i}]: must be an object")
                     continue
+                prefix = f"SystemPrompt [{i}] '{prompt.get('id', '?')}'"
                 if "id" not in prompt:
                     errors.append(f"{prefix}: missing 'id'")
-                elif prompt["id"] in seen_ids:
-                    errors.append(f"{prefix}: duplicate prompt ID")
-                else:
-                    seen_ids.add(prompt["id"])
                 if "name" not in prompt:
                     errors.append(f"{prefix}: missing 'name'")
                 if "prompt" not in prompt:
@@ -478,16 +528,19 @@ def validate_templates(path: str = None) -> list[str]:
                 # XSS check on all string fields
                 for field in ("name", "prompt", "category", "icon"):
                     val = prompt.get(field, "")
-                    if isinstance(val, str) and XSS_FORBIDDEN.search(val):
+                    if type(val) is str and XSS_FORBIDDEN.search(val):
                         errors.append(f"{prefix}: field '{field}' contains XSS pattern")
+            prompts = data["systemPrompts"]
+            for prompt_id, count in _duplicates(p["id"] for p in prompts if type(p) is dict and "id" in p):
+                errors.append(f"SystemPrompt '{prompt_id}': duplicate prompt ID ({count} occurrences)")
 
     # Validate prompt categories
     if "promptCategories" in data:
-        if not isinstance(data["promptCategories"], list):
+        if type(data["promptCategories"]) is not list:
             errors.append("'promptCategories' must be an array")
         else:
             for i, cat in enumerate(data["promptCategories"]):
-                if not isinstance(cat, dict):
+                if type(cat) is not dict:
                     errors.append(f"PromptCategory [{i}]: must be an object")
                     continue
                 if "id" not in cat:
@@ -497,89 +550,89 @@ def validate_templates(path: str = None) -> list[str]:
 
     # Validate welcome screens
     if "welcomeScreens" in data:
-        if not isinstance(data["welcomeScreens"], list):
+        if type(data["welcomeScreens"]) is not list:
             errors.append("'welcomeScreens' must be an array")
         else:
-            seen_ids = set()
             for i, screen in enumerate(data["welcomeScreens"]):
-                prefix = f"WelcomeScreen [{i}] '{screen.get('id', '?')}'"
-                if not isinstance(screen, dict):
+                if type(screen) is not dict:
                     errors.append(f"WelcomeScreen [{i}]: must be an object")
                     continue
+                prefix = f"WelcomeScreen [{i}] '{screen.get('id', '?')}'"
                 if "id" not in screen:
                     errors.append(f"{prefix}: missing 'id'")
-                elif screen["id"] in seen_ids:
-                    errors.append(f"{prefix}: duplicate screen ID")
-                else:
-                    seen_ids.add(screen["id"])
                 if "heading" not in screen:
                     errors.append(f"{prefix}: missing 'heading'")
                 # XSS checks
                 for field in ("heading", "subtitle", "name"):
                     val = screen.get(field)
-                    if isinstance(val, str) and XSS_FORBIDDEN.search(val):
+                    if type(val) is str and XSS_FORBIDDEN.search(val):
                         errors.append(f"{prefix}: field '{field}' contains XSS pattern")
                 # Validate cards
                 if "cards" in screen:
-                    if not isinstance(screen["cards"], list):
+                    if type(screen["cards"]) is not list:
                         errors.append(f"{prefix}: 'cards' must be an array")
                     else:
                         for j, card in enumerate(screen["cards"]):
                             card_prefix = f"{prefix} card [{j}]"
-                            if not isinstance(card, dict):
+                            if type(card) is not dict:
                                 errors.append(f"{card_prefix}: must be an object")
                                 continue
                             if "action" in card and card["action"] and card["action"] not in VALID_WELCOME_ACTIONS:
-                                errors.append(f"{card_prefix}: invalid action '{card['action']}' (allowed: {VALID_WELCOME_ACTIONS})")
+                                errors.append(f"{card_prefix}: invalid action '{card['action']}' (allowed: {_fmt_set(VALID_WELCOME_ACTIONS)})")
                             for field in ("title", "description", "icon"):
                                 val = card.get(field, "")
-                                if isinstance(val, str) and XSS_FORBIDDEN.search(val):
+                                if type(val) is str and XSS_FORBIDDEN.search(val):
                                     errors.append(f"{card_prefix}: field '{field}' contains XSS pattern")
+            screens = data["welcomeScreens"]
+            for screen_id, count in _duplicates(w["id"] for w in screens if type(w) is dict and "id" in w):
+                errors.append(f"WelcomeScreen '{screen_id}': duplicate screen ID ({count} occurrences)")
+
+    return errors, data
+
+
+def validate_templates(path: str = None) -> list[str]:
+    """Validate the templates registry. Returns list of error strings."""
+    return _validate_templates(path)[0]
 
-    return errors
+
+def _templates_summary(data: dict) -> str:
+    prompts = len(data.get('systemPrompts', []))
+    screens = len(data.get('welcomeScreens', []))
+    return f"{prompts} prompts, {screens} welcome screens validated"
+
+
+# CLI name -> (report label, validator returning (errors, data), success summary)
+REGISTRY_COMMANDS = {
+    "models": ("MODELS", _validate_models, lambda data: f"{len(data['models'])} models validated"),
+    "packages": ("PACKAGES", _validate_packages, lambda data: f"{len(data['packages'])} packages validated"),
+    "themes": ("THEMES", _validate_themes, lambda data: f"{len(data['themes'])} themes validated"),
+    "templates": ("TEMPLATES", _validate_templates, _templates_summary),
+}
+
+
+def _report(name: str, path: str = None) -> int:
+    """Validate one registry, print the CLI report and return its exit code."""
+    label, validator, summary = REGISTRY_COMMANDS[name]
+    errors, data = validator(path)
+    if errors:
+        print(f"{label} FAILED — {len(errors)} error(s):")
+        for e in errors:
+            print(f"  - {e}")
+        return 1
+    print(f"{label} OK — {summary(data)}")
+    return 0
 
 
 if __name__ == "__main__":
     cmd = sys.argv[1] if len(sys.argv) > 1 else None
     exit_code = 0
 
-    if cmd == "packages":
-        pkg_path = sys.argv[2] if len(sys.argv) > 2 else None
-        errors = validate_packages(pkg_path)
-        if errors:
-            print(f"PACKAGES FAILED — {len(errors)} error(s):")
-            for e in errors:
-                print(f"  - {e}")
-            exit_code = 1
-        else:
-            data = json.loads((Path(pkg_path) if pkg_path else Path(__file__).parent / "packages.json").read_text())
-            print(f"PACKAGES OK — {len(data['packages'])} packages validated")
+    if cmd in REGISTRY_COMMANDS:
+        exit_code = _report(cmd, sys.argv[2] if len(sys.argv) > 2 else None)
 
-    elif cmd == "themes":
-        theme_path = sys.argv[2] if len(sys.argv) > 2 else None
-        errors = validate_themes(theme_path)
-        if errors:
-            print(f"THEMES FAILED — {len(errors)} error(s):")
-            for e in errors:
-                print(f"  - {e}")
-            exit_code = 1
-        else:
-            data = json.loads((Path(theme_path) if theme_path else Path(__file__).parent / "themes.json").read_text())
-            print(f"THEMES OK — {len(data['themes'])} themes validated")
-
-    elif cmd == "templates":
-        tpl_path = sys.argv[2] if len(sys.argv) > 2 else None
-        errors = validate_templates(tpl_path)
-        if errors:
-            print(f"TEMPLATES FAILED — {len(errors)} error(s):")
-            for e in errors:
-                print(f"  - {e}")
-            exit_code = 1
-        else:
-            data = json.loads((Path(tpl_path) if tpl_path else Path(__file__).parent / "templates.json").read_text())
-            prompts = len(data.get('systemPrompts', []))
-            screens = len(data.get('welcomeScreens', []))
-            print(f"TEMPLATES OK — {prompts} prompts, {screens} welcome screens validated")
+    elif cmd == "all":
+        # Every registry at its default path, in one interpreter
+        exit_code = max([_report(name) for name in REGISTRY_COMMANDS])
 
     elif cmd == "manifest":
         if len(sys.argv) < 3:
@@ -587,8 +640,8 @@ if __name__ == "__main__":
             sys.exit(1)
         manifest_path = Path(sys.argv[2])
         try:
-            manifest = json.loads(manifest_path.read_text())
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            manifest = json_loads(manifest_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, FileNotFoundError) as e:
             print(f"MANIFEST FAILED — {e}")
             sys.exit(1)
         errors = validate_manifest(manifest)
@@ -602,15 +655,6 @@ if __name__ == "__main__":
 
     else:
         # Default: validate models.json (backward compatible)
-        path = cmd  # cmd is either a path or None
-        errors = validate(path)
-        if errors:
-            print(f"MODELS FAILED — {len(errors)} error(s):")
-            for e in errors:
-                print(f"  - {e}")
-            exit_code = 1
-        else:
-            data = json.loads((Path(path) if path else Path(__file__).parent / "models.json").read_text())
-            print(f"MODELS OK — {len(data['models'])} models validated")
+        exit_code = _report("models", cmd)  # cmd is either a path or None
 
     sys.exit(exit_code)